@@ -8,6 +8,7 @@ This module exposes the public API and makes the CLI available as
 from __future__ import annotations
 from .shadowlink import (
     main,
+    generate_masked_urls,
     mask_url,
     validate_url,
     validate_domain,
@@ -17,6 +18,7 @@ from .version import __version__
 
 __all__: list[str] = [
     "main",
+    "generate_masked_urls",
     "mask_url",
     "validate_url",
     "validate_domain",
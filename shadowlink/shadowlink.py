@@ -14,20 +14,25 @@ real destination behind a trusted‑looking domain.
 
 from __future__ import annotations
 
-import re
+import contextlib
+import functools
+import itertools
+import os
+import string
 import sys
-import time
-from typing import Match, Optional
-from urllib.parse import urlparse
+import threading
+from typing import Callable, Iterator
 
-import pyshorteners
+# pyshorteners and concurrent.futures are imported where links are shortened:
+# they are not needed for the banner and prompts, and concurrent.futures alone
+# is about half of the module's import time.
 
-# Terminal colours (ANSI escape sequences)
-RED = "\033[31m"
-GRN = "\033[32m"
-YLW = "\033[33m"
-CYN = "\033[36m"
-RST = "\033[0m"
+# Terminal colours (ANSI escape sequences) – chosen once at import and left
+# empty when stdout is not a terminal or NO_COLOR is non-empty (https://no-color.org)
+_ANSI = ("\033[31m", "\033[32m", "\033[33m", "\033[36m", "\033[0m")
+_STDOUT_IS_TTY = sys.stdout is not None and sys.stdout.isatty()
+_USE_COLOR = _STDOUT_IS_TTY and not os.environ.get("NO_COLOR")
+RED, GRN, YLW, CYN, RST = _ANSI if _USE_COLOR else ("",) * len(_ANSI)
 
 # Project metadata – pulled from the package root
 from .version import __version__ as VERSION  # noqa: E402  (after imports)
@@ -46,55 +51,181 @@ BANNER = r"""
 """
 # ╰────────────────────────────────────────────────────────────────────────╯
 
+# Banner plus metadata, formatted once since every piece is fixed at import
+_BANNER_RENDERED = (
+    f"{CYN}{BANNER}{RST}\n"
+    f"{GRN}➤ Version      : {RST}{VERSION}\n"
+    f"{GRN}➤ Author       : {RST}{AUTHOR}\n"
+    f"{GRN}➤ GitHub       : {RST}{GITHUB}\n\n"
+)
+
 
 def show_banner() -> None:
     """Print the stylised ASCII banner and project metadata."""
-    print(f"{CYN}{BANNER}{RST}")
-    print(f"{GRN}➤ Version      : {RST}{VERSION}")
-    print(f"{GRN}➤ Author       : {RST}{AUTHOR}")
-    print(f"{GRN}➤ GitHub       : {RST}{GITHUB}\n")
+    sys.stdout.write(_BANNER_RENDERED)
 
 
 # ────────────────────────────── Helpers ──────────────────────────────────
 
-def loading_spinner() -> None:
-    """Display a small spinner while we contact shortening services."""
-    spinner = ["◐", "◓", "◑", "◒"]
-    for _ in range(12):
-        for frame in spinner:
-            sys.stdout.write(f"\r{RED}⟳ Please wait... generating your masked links {frame}{RST}")
-            sys.stdout.flush()
-            time.sleep(0.1)
-    sys.stdout.write("\r\033[K")
+SPINNER_FRAMES: tuple[str, ...] = ("◐", "◓", "◑", "◒")
+SPINNER_DELAY = 0.1  # seconds per frame
 
 
-_URL_RE = re.compile(r"^(https?://)[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}(:\d{1,5})?(/.*)?$")
-_DOMAIN_RE = re.compile(r"^[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+def _spin(stop: threading.Event) -> None:
+    """Draw spinner frames until *stop* is set, then clear the line."""
+    for frame in itertools.cycle(SPINNER_FRAMES):
+        sys.stdout.write(f"\r{RED}⟳ Please wait... generating your masked links {frame}{RST}")
+        sys.stdout.flush()
+        if stop.wait(SPINNER_DELAY):  # wakes up as soon as the work is done
+            break
+    sys.stdout.write("\r\033[K")
+    sys.stdout.flush()
+
+
+@contextlib.contextmanager
+def loading_spinner() -> Iterator[None]:
+    """Animate a spinner in a background thread while the ``with`` block runs."""
+    if not _STDOUT_IS_TTY:
+        yield
+        return
+    stop = threading.Event()
+    thread = threading.Thread(target=_spin, args=(stop,), daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+
+_LABEL_CHARS = frozenset(string.ascii_letters + string.digits + "-")
+_TLD_CHARS = frozenset(string.ascii_letters)
+
+
+def _is_hostname(host: str) -> bool:
+    """Return ``True`` if *host* is dot-separated LDH labels ending in a valid TLD.
+
+    Each label is 1–63 letters, digits or hyphens and may not start or end
+    with a hyphen (RFC 1123); punycode labels such as ``xn--80ak6aa92e``
+    therefore pass unchanged. The TLD is alphabetic, or an ``xn--`` label
+    for internationalised TLDs such as ``xn--p1ai``.
+    """
+    if not 0 < len(host) <= 253:  # RFC 1035 limit; also skips splitting huge input
+        return False
+    *labels, tld = host.split(".")
+    if not labels or not 2 <= len(tld) <= 63:
+        return False
+    if tld[:4].lower() == "xn--":
+        labels.append(tld)  # punycode TLDs follow the ordinary label rules
+    elif not _TLD_CHARS.issuperset(tld):
+        return False
+    return all(
+        0 < len(label) <= 63
+        and label[0] != "-"
+        and label[-1] != "-"
+        and _LABEL_CHARS.issuperset(label)
+        for label in labels
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def validate_url(url: str) -> bool:
+    """Return ``True`` if *url* is a syntactically valid HTTP(S) URL."""
+    if url.startswith("https://"):
+        rest = url[8:]
+    elif url.startswith("http://"):
+        rest = url[7:]
+    else:
+        return False
+
+    authority, _, path = rest.partition("/")
+    if "\n" in path:
+        return False
+    host, colon, port = authority.partition(":")
+    if colon and not (port.isdecimal() and len(port) <= 5):
+        return False
+    return _is_hostname(host)
+
+
+@functools.lru_cache(maxsize=1024)
+def validate_domain(domain: str) -> bool:
+    """Return ``True`` if *domain* looks like a hostname+TLD (e.g. x.com)."""
+    return _is_hostname(domain)
 
 
-def validate_url(url: str) -> Optional[Match[str]]:
-    """Return a regex match if *url* is a syntactically valid HTTP(S) URL."""
-    return _URL_RE.match(url)
+def validate_keyword(keyword: str) -> bool:
+    """Keyword must be ≤ 15 characters and contain no whitespace or control chars."""
+    return len(keyword) <= 15 and " " not in keyword and keyword.isprintable()
 
 
-def validate_domain(domain: str) -> Optional[Match[str]]:
-    """Return a regex match if *domain* looks like a hostname+TLD (e.g. x.com)."""
-    return _DOMAIN_RE.match(domain)
+def _mask_template(domain: str, keyword: str) -> Callable[[str], str]:
+    """Return a masker with the ``://domain-keyword@`` infix built once."""
+    infix = f"://{domain}-{keyword}@"
 
+    def mask(short_url: str) -> str:
+        scheme, sep, rest = short_url.partition("://")
+        if not sep or scheme not in ("http", "https"):
+            raise ValueError(f"Unexpected short URL: {short_url!r}")
+        return scheme + infix + rest
 
-def validate_keyword(keyword: str) -> bool:
-    """Keyword must be ≤ 15 characters and contain no spaces."""
-    return " " not in keyword and len(keyword) <= 15
+    return mask
 
 
 def mask_url(domain: str, keyword: str, short_url: str) -> str:
     """Inject *domain* and *keyword* into *short_url* to form the disguised link."""
-    parsed = urlparse(short_url)
-    return f"{parsed.scheme}://{domain}-{keyword}@{parsed.netloc}{parsed.path}"
+    return _mask_template(domain, keyword)(short_url)
+
+
+# Shortening services queried for every link, in display order
+SERVICES: tuple[str, ...] = ("tinyurl", "dagd", "clckru", "osdb")
+
+
+@functools.cache
+def _service_shorteners() -> dict[str, Callable[[str], str]]:
+    """Map each name in ``SERVICES`` to its ``short`` method, built once per process."""
+    import pyshorteners
+
+    shortener = pyshorteners.Shortener()
+    return {name: getattr(shortener, name).short for name in SERVICES}
+
+
+@functools.lru_cache(maxsize=1024)
+def _shorten(service: str, url: str) -> str:
+    """Shorten *url* with *service*; successful results are cached per pair."""
+    return _service_shorteners()[service](url)
+
+
+def generate_masked_urls(target_url: str, domain: str, keyword: str) -> list[str | Exception]:
+    """Shorten *target_url* with every service concurrently and mask the results.
+
+    Entries follow ``SERVICES`` order; a service that failed contributes its
+    exception instead of a masked link.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    _service_shorteners()  # build once here rather than racing in the workers
+    mask = _mask_template(domain, keyword)
+    results: list[str | Exception] = [""] * len(SERVICES)
+    with ThreadPoolExecutor(max_workers=len(SERVICES)) as pool:
+        futures = {pool.submit(_shorten, name, target_url): idx for idx, name in enumerate(SERVICES)}
+        # Mask each link as soon as its service answers, not after the slowest
+        for future in as_completed(futures):
+            try:
+                results[futures[future]] = mask(future.result())
+            except Exception as exc:
+                results[futures[future]] = exc
+    return results
 
 
 # ────────────────────────────── CLI logic ────────────────────────────────
 
+def get_user_input(prompt: str, validator: Callable[[str], bool], error: str) -> str:
+    """Prompt until *validator* accepts the answer, printing *error* after each miss."""
+    while not validator(answer := input(prompt)):
+        print(error)
+    return answer
+
+
 def main() -> None:  # noqa: C901 (complexity fine for CLI script)
     """Interactive command‑line interface entry point."""
 
@@ -102,44 +233,38 @@ def main() -> None:  # noqa: C901 (complexity fine for CLI script)
 
     try:
         # 1. Target URL ----------------------------------------------------
-        while True:
-            target_url = input(
-                f"{YLW}➤ Paste the original link to cloak {RST}(e.g. https://example.com): {RST}"
-            )
-            if validate_url(target_url):
-                break
-            print(f"{RED}✖ That doesn't seem like a valid URL. Please double‑check and try again.{RST}")
+        target_url = get_user_input(
+            f"{YLW}➤ Paste the original link to cloak {RST}(e.g. https://example.com): {RST}",
+            validate_url,
+            f"{RED}✖ That doesn't seem like a valid URL. Please double‑check and try again.{RST}",
+        )
 
         # 2. Fake domain ---------------------------------------------------
-        while True:
-            custom_domain = input(f"{YLW}➤ Enter a domain to disguise as {RST}(e.g. x.com): {RST}")
-            if validate_domain(custom_domain):
-                break
-            print(f"{RED}✖ Invalid domain format. Try something like facebook.com or gmail.com.{RST}")
+        custom_domain = get_user_input(
+            f"{YLW}➤ Enter a domain to disguise as {RST}(e.g. x.com): {RST}",
+            validate_domain,
+            f"{RED}✖ Invalid domain format. Try something like facebook.com or gmail.com.{RST}",
+        )
 
         # 3. Keyword -------------------------------------------------------
-        while True:
-            keyword = input(f"{YLW}➤ Choose a keyword to add (e.g. login, signup, verify): {RST}")
-            if validate_keyword(keyword):
-                break
-            print(f"{RED}✖ Keyword must be ≤ 15 chars with no spaces.{RST}")
+        keyword = get_user_input(
+            f"{YLW}➤ Choose a keyword to add (e.g. login, signup, verify): {RST}",
+            validate_keyword,
+            f"{RED}✖ Keyword must be ≤ 15 chars with no whitespace or control characters.{RST}",
+        )
 
         # 4. Shorten & cloak ----------------------------------------------
-        loading_spinner()
-
-        shortener = pyshorteners.Shortener()
-        services = [shortener.tinyurl, shortener.dagd, shortener.clckru, shortener.osdb]
+        with loading_spinner():
+            masked_urls = generate_masked_urls(target_url, custom_domain, keyword)
 
         print(f"\n{CYN}➤ Original URL:{RST} {target_url}\n")
         print(f"{GRN}[✓] Successfully generated masked URLs:\n")
 
-        for idx, svc in enumerate(services, start=1):
-            try:
-                short = svc.short(target_url)
-                masked = mask_url(custom_domain, keyword, short)
+        for idx, masked in enumerate(masked_urls, start=1):
+            if isinstance(masked, Exception):  # pragma: no cover – network issues
+                print(f"{RED}✖ Failed with service {idx}: {masked}{RST}")
+            else:
                 print(f"{CYN}➤ Link {idx}:{RST} {masked}")
-            except Exception as exc:  # pragma: no cover – network issues
-                print(f"{RED}✖ Failed with service {idx}: {exc}{RST}")
 
     except KeyboardInterrupt:
         print(f"\n{RED}✖ Interrupted by user. Exiting...{RST}")
@@ -1,48 +1,236 @@
 """Unit tests for shadowlink.shadowlink module."""
 
-import re
+import subprocess
+import sys
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
 import pytest
 from shadowlink.shadowlink import (
+    SERVICES,
+    SPINNER_FRAMES,
+    _service_shorteners,
+    _shorten,
+    generate_masked_urls,
+    get_user_input,
+    loading_spinner,
     validate_url,
     validate_domain,
     validate_keyword,
     mask_url,
+    show_banner,
 )
+from shadowlink.version import __version__
+
 
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://example.com",
+        "http://site.org/path?query=123",
+        "https://example.com:8080/login",
+    ],
+)
+def test_validate_url_valid(url):
+    assert validate_url(url)
 
-def test_validate_url_valid():
-    assert validate_url("https://example.com")
-    assert validate_url("http://site.org/path?query=123")
 
+@pytest.mark.parametrize(
+    "url",
+    [
+        "not_a_url",
+        "ftp://invalid.com",
+        "http:/missing-slash.com",
+        "https://example.com:123456",
+        "https://example.com?query=1",
+    ],
+)
+def test_validate_url_invalid(url):
+    assert not validate_url(url)
 
-def test_validate_url_invalid():
-    assert not validate_url("not_a_url")
-    assert not validate_url("ftp://invalid.com")
-    assert not validate_url("http:/missing-slash.com")
 
+def test_validators_return_bool():
+    assert validate_url("https://example.com") is True
+    assert validate_url("not_a_url") is False
+    assert validate_domain("google.com") is True
+    assert validate_domain("no-tld") is False
 
-def test_validate_domain_valid():
-    assert validate_domain("google.com")
-    assert validate_domain("sub.domain.co.uk")
 
+def test_validators_handle_pathological_input():
+    # Inputs that make backtracking URL/domain regexes go quadratic; clear the
+    # memo caches so every call really scans its input
+    validate_url.cache_clear()
+    validate_domain.cache_clear()
+    start = time.perf_counter()
+    assert not validate_url("https://" + "a" * 100_000)
+    assert not validate_url("https://" + "a-" * 50_000 + "!")
+    assert validate_url("https://example.com/" + "a" * 100_000)
+    assert not validate_domain("a" * 100_000 + ".com")
+    assert time.perf_counter() - start < 1.0
 
-def test_validate_domain_invalid():
-    assert not validate_domain("no-tld")
-    assert not validate_domain("in valid.com")
-    assert not validate_domain("domain.")
 
+@pytest.mark.parametrize(
+    "domain", ["google.com", "sub.domain.co.uk", "my-site.xn--p1ai.com", "example.xn--p1ai"]
+)
+def test_validate_domain_valid(domain):
+    assert validate_domain(domain)
 
-def test_validate_keyword_valid():
-    assert validate_keyword("login")
-    assert validate_keyword("verify123")
 
+@pytest.mark.parametrize(
+    "domain",
+    [
+        "no-tld",
+        "in valid.com",
+        "domain.",
+        "double..dot.com",
+        "-leading.com",
+        "trailing-.com",
+        "example.xn--",
+        "example.p1ai1",
+        pytest.param("a" * 64 + ".com", id="label-over-63"),
+        pytest.param("a." * 130 + "com", id="host-over-253"),
+    ],
+)
+def test_validate_domain_invalid(domain):
+    assert not validate_domain(domain)
 
-def test_validate_keyword_invalid():
-    assert not validate_keyword("this has spaces")
-    assert not validate_keyword("toolongkeywordfortest")  # >15 chars
+
+@pytest.mark.parametrize("keyword", ["login", "verify123"])
+def test_validate_keyword_valid(keyword):
+    assert validate_keyword(keyword)
+
+
+@pytest.mark.parametrize(
+    "keyword",
+    [
+        "this has spaces",
+        "toolongkeywordfortest",  # >15 chars
+        "tab\there",
+        "line\nbreak",
+    ],
+)
+def test_validate_keyword_invalid(keyword):
+    assert not validate_keyword(keyword)
 
 
 def test_mask_url():
     short_url = "https://tinyurl.com/abc123"
     masked = mask_url("facebook.com", "login", short_url)
     assert masked.startswith("https://facebook.com-login@tinyurl.com/")
+
+
+def test_mask_url_keeps_scheme_and_path():
+    masked = mask_url("x.com", "verify", "http://da.gd/a/b")
+    assert masked == "http://x.com-verify@da.gd/a/b"
+
+
+@pytest.fixture(autouse=True)
+def _clear_shorten_cache():
+    _service_shorteners.cache_clear()
+    _shorten.cache_clear()
+    yield
+    _service_shorteners.cache_clear()
+    _shorten.cache_clear()
+
+
+@pytest.fixture
+def shortener_cls():
+    """Patch pyshorteners.Shortener; every service answers https://<service>.example/abc."""
+    fake = SimpleNamespace(
+        **{
+            name: SimpleNamespace(short=lambda url, name=name: f"https://{name}.example/abc")
+            for name in SERVICES
+        }
+    )
+    with patch("pyshorteners.Shortener", return_value=fake) as patched:
+        yield patched
+
+
+@pytest.fixture
+def shortener(shortener_cls):
+    """The fake Shortener instance every service lookup goes through."""
+    return shortener_cls.return_value
+
+
+def test_mask_url_rejects_non_http_short_url():
+    with pytest.raises(ValueError, match="Unexpected short URL"):
+        mask_url("x.com", "verify", "Error: rate limited")
+
+
+def test_generate_masked_urls_keeps_service_order_and_errors(shortener):
+    shortener.clckru.short = Mock(side_effect=RuntimeError("service down"))
+
+    results = generate_masked_urls("https://example.com", "facebook.com", "login")
+
+    assert results[0] == "https://facebook.com-login@tinyurl.example/abc"
+    assert results[1] == "https://facebook.com-login@dagd.example/abc"
+    assert isinstance(results[2], RuntimeError)
+    assert results[3] == "https://facebook.com-login@osdb.example/abc"
+
+
+def test_generate_masked_urls_reuses_cached_short_links(shortener):
+    shortener.tinyurl.short = Mock(return_value="https://tinyurl.example/abc")
+
+    first = generate_masked_urls("https://example.com", "facebook.com", "login")
+    second = generate_masked_urls("https://example.com", "x.com", "verify")
+
+    assert shortener.tinyurl.short.call_count == 1
+    assert first[0] == "https://facebook.com-login@tinyurl.example/abc"
+    assert second[0] == "https://x.com-verify@tinyurl.example/abc"
+
+
+def test_generate_masked_urls_builds_shortener_once(shortener_cls):
+    generate_masked_urls("https://example.com", "facebook.com", "login")
+    generate_masked_urls("https://example.org", "facebook.com", "login")
+
+    shortener_cls.assert_called_once()
+
+
+def test_show_banner(capsys):
+    show_banner()
+    out = capsys.readouterr().out
+    assert "ShadowLink – Ultimate URL Cloaking Tool" in out
+    assert f"Version      : {__version__}" in out
+    assert out.endswith("\n\n")
+
+
+def test_validators_memoize_repeat_input():
+    validate_url.cache_clear()
+    for _ in range(3):
+        assert validate_url("https://example.com/login")
+    assert validate_url.cache_info().hits == 2
+
+
+def test_loading_spinner_runs_only_for_the_block(capsys, monkeypatch):
+    monkeypatch.setattr("shadowlink.shadowlink._STDOUT_IS_TTY", True)
+    monkeypatch.setattr("shadowlink.shadowlink.SPINNER_DELAY", 0.001)
+    with loading_spinner():
+        time.sleep(0.05)
+    out = capsys.readouterr().out
+    # One frame per delay tick, cycling through SPINNER_FRAMES in order
+    frames = [f for chunk in out.split("\r") for f in SPINNER_FRAMES if f in chunk]
+    assert len(frames) > 1
+    assert frames[: len(SPINNER_FRAMES)] == list(SPINNER_FRAMES)[: len(frames)]
+    assert out.endswith("\r\033[K")
+
+
+def test_loading_spinner_silent_without_tty(capsys, monkeypatch):
+    monkeypatch.setattr("shadowlink.shadowlink._STDOUT_IS_TTY", False)
+    with loading_spinner():
+        pass
+    assert capsys.readouterr().out == ""
+
+
+def test_get_user_input_retries_until_valid(capsys):
+    with patch("builtins.input", side_effect=["not_a_url", "https://example.com"]) as fake_input:
+        answer = get_user_input("URL: ", validate_url, "bad url")
+    assert answer == "https://example.com"
+    assert fake_input.call_count == 2
+    assert capsys.readouterr().out == "bad url\n"
+
+
+def test_import_without_stdout():
+    # pythonw and some embedded hosts run with sys.stdout set to None
+    code = "import sys; sys.stdout = None; import shadowlink"
+    subprocess.run([sys.executable, "-c", code], check=True)